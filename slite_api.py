@@ -6,248 +6,1173 @@ allowing for creation, updating, and management of documents and folders.
 It includes event handling capabilities for various Slite operations.
 """
 
+import asyncio
+import contextvars
+import inspect
 import requests
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import Dict, Optional, List, Callable
+import random
+import threading
+import time
+import weakref
+from typing import Dict, Optional, List, Callable, Tuple, Set, Iterator, AsyncIterator, Awaitable, Coroutine, Union, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, partialmethod
+from types import MappingProxyType
+from collections import OrderedDict, defaultdict
 from datetime import datetime
-import json
+from enum import Enum
+import orjson
 
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
+# Line prefixes rendered as section headings in ProseMirror content
+_HEADER_PREFIXES = ('Meeting Notes:', 'Date:', 'Time:', 'Attendees:', 'Facilitator:')
+
+# Node templates copied when building ProseMirror blocks; each copy gets
+# its own "content" list
+_HEADING_TEMPLATE = {"type": "heading", "attrs": {"level": 2}}
+_PARAGRAPH_TEMPLATE = {"type": "paragraph"}
+_BULLET_LIST_TEMPLATE = {"type": "bulletList"}
+_LIST_ITEM_TEMPLATE = {"type": "listItem"}
+
+# Converted documents are read-only, so every blank line shares this node
+_EMPTY_PARAGRAPH = {"type": "paragraph", "content": [{"type": "text", "text": ""}]}
+
+# Line kinds produced by SliteAPIBase._line_to_node
+_LINE_BLANK = "blank"
+_LINE_BULLET = "bullet"
+_LINE_HEADING = "heading"
+_LINE_TEXT = "text"
+
+# Errors raised for failed responses regardless of the endpoint
+_STATUS_HANDLERS: Dict[int, Callable] = {
+    401: lambda response: Exception("Invalid API key"),
+    429: lambda response: Exception("Rate limit exceeded")
+}
+
+# (epoch second, formatted local time) of the last metadata timestamp
+_ts_cache = (0, "")
+
+def _now_str() -> str:
+    """
+    Current local time formatted for metadata, formatted at most once per second.
+    The cache is swapped as a single tuple so concurrent threads never see a
+    second paired with another second's string.
+    """
+    global _ts_cache
+    now = int(time.time())
+    second, formatted = _ts_cache
+    if second != now:
+        formatted = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        _ts_cache = (now, formatted)
+    return formatted
+
+# Options for the meeting notes cache key. Values that orjson would encode
+# like a different plain JSON value but that render differently (datetimes,
+# dataclasses, subclasses of built-in types) raise TypeError instead
+_MD_KEY_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+)
+
+def _contains_enum(value) -> bool:
+    """Whether an Enum member appears anywhere in nested dicts and lists"""
+    if isinstance(value, Enum):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_enum(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_enum(item) for item in value)
+    return False
+
+# Size of the chunks produced when streaming large request bodies
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+def _iter_json(value) -> Iterator[bytes]:
+    """
+    Encode a value as JSON piece by piece.
+    Dictionaries are walked key by key and list elements are encoded one at
+    a time. Elements holding a "content" list of child nodes are walked as
+    well, so only leaf nodes are ever serialized at once.
+    """
+    if isinstance(value, dict):
+        yield b"{"
+        for i, (key, item) in enumerate(value.items()):
+            if i:
+                yield b","
+            yield orjson.dumps(key)
+            yield b":"
+            yield from _iter_json(item)
+        yield b"}"
+    elif isinstance(value, list):
+        yield b"["
+        for i, item in enumerate(value):
+            if i:
+                yield b","
+            if isinstance(item, dict) and isinstance(item.get("content"), list):
+                yield from _iter_json(item)
+            else:
+                yield orjson.dumps(item)
+        yield b"]"
+    else:
+        yield orjson.dumps(value)
+
+class _JSONStream:
+    """
+    Chunked JSON request body, sent with Transfer-Encoding: chunked.
+    Every iteration encodes the data from scratch, so the body can be sent
+    again when a request is retried.
+    """
+    
+    def __init__(self, data: Dict, chunk_size: int = _STREAM_CHUNK_SIZE):
+        self.data = data
+        self.chunk_size = chunk_size
+        
+    def __iter__(self) -> Iterator[bytes]:
+        buffer = bytearray()
+        for piece in _iter_json(self.data):
+            buffer += piece
+            if len(buffer) >= self.chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+class _AsyncJSONStream:
+    """Asynchronous view of a _JSONStream, as required by httpx.AsyncClient"""
+    
+    def __init__(self, stream: _JSONStream):
+        self.stream = stream
+        
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.stream:
+            yield chunk
+
+# Event loop of the coroutine awaiting an SliteAPI a* wrapper, visible to
+# the worker thread running the blocking call
+_caller_loop: contextvars.ContextVar[Optional[asyncio.AbstractEventLoop]] = contextvars.ContextVar("_caller_loop", default=None)
+
+def _as_coroutine(awaitable: Awaitable) -> Coroutine:
+    """Return awaitable as a coroutine, as required by create_task and asyncio.run"""
+    if inspect.iscoroutine(awaitable):
+        return awaitable
+    
+    async def wait():
+        return await awaitable
+    return wait()
+
+def _identity(value):
+    """Return value unchanged; bound with partial as a strong handler reference"""
+    return value
+
 class SliteEventHandler:
     """
     Event handler for Slite operations.
     Manages callbacks for folder and document creation/update events.
+    
+    Handlers may be plain functions or callables returning an awaitable,
+    such as coroutine functions. Awaitable results are scheduled as tasks
+    on the running event loop and are
+    fire-and-forget unless the caller awaits the task list returned by
+    trigger() or the trigger_* methods. When triggered from the worker
+    thread of an SliteAPI a* wrapper they are scheduled on the loop that
+    awaited the wrapper. Otherwise, without a running loop, they are run to
+    completion before trigger returns.
     """
     
     def __init__(self):
-        """Initialize lists to store event handlers for different operations"""
-        self.folder_created_handlers: List[Callable] = []
-        self.folder_updated_handlers: List[Callable] = []
-        self.document_created_handlers: List[Callable] = []
-        self.document_updated_handlers: List[Callable] = []
-        
-    def on_folder_created(self, handler: Callable):
-        """Register a callback for folder creation events"""
-        self.folder_created_handlers.append(handler)
+        """Initialize the registry of event handlers, keyed by event name"""
+        # References returning the handler, or None once it has been collected
+        self._handlers: Dict[str, List[Callable[[], Optional[Callable]]]] = defaultdict(list)
+        # Strong references to running handler tasks so they are not collected early
+        self._tasks: Set[asyncio.Task] = set()
         
-    def on_folder_updated(self, handler: Callable):
-        """Register a callback for folder update events"""
-        self.folder_updated_handlers.append(handler)
+    def on(self, event_type: str, handler: Callable, strong: bool = False):
+        """
+        Register a callback for an event.
+        Bound methods are held through a weak reference so registering
+        obj.method does not keep obj alive; the handler is dropped once obj
+        is collected. Other callables are held strongly, since lambdas and
+        closures usually have no other reference, as are methods of objects
+        that do not support weak references.
+        Args:
+            event_type: Event name, e.g. "folder_created"
+            handler: Callable receiving the event data
+            strong: Hold bound methods strongly as well
+        """
+        ref = None
+        if inspect.ismethod(handler) and not strong:
+            try:
+                ref = weakref.WeakMethod(handler)
+            except TypeError:
+                # The owner uses __slots__ without __weakref__
+                pass
+        if ref is None:
+            ref = partial(_identity, handler)
+        self._handlers[event_type].append(ref)
         
-    def on_document_created(self, handler: Callable):
-        """Register a callback for document creation events"""
-        self.document_created_handlers.append(handler)
+    def trigger(self, event_type: str, data: Dict) -> List[asyncio.Task]:
+        """
+        Trigger all handlers registered for an event
+        Args:
+            event_type: Event name, e.g. "folder_created"
+            data: Dictionary containing the event information
+        Returns:
+            Tasks scheduled for coroutine handlers on the running loop
+        """
+        refs = self._handlers.get(event_type)
+        if not refs:
+            return []
+            
+        tasks = []
+        for ref in list(refs):
+            handler = ref()
+            if handler is None:
+                # The handler's owner has been garbage collected
+                try:
+                    refs.remove(ref)
+                except ValueError:
+                    # Already pruned by a concurrent or nested trigger
+                    pass
+                continue
+            task = self._invoke(event_type, handler, data)
+            if task is not None:
+                tasks.append(task)
+        return tasks
         
-    def on_document_updated(self, handler: Callable):
-        """Register a callback for document update events"""
-        self.document_updated_handlers.append(handler)
+    # Alias of trigger, dispatching by event name
+    dispatch = trigger
         
-    def trigger_folder_created(self, folder_data: Dict):
+    def _invoke(self, event_type: str, handler: Callable, data: Dict) -> Optional[asyncio.Task]:
         """
-        Trigger all registered folder creation handlers
+        Call a single handler, scheduling its result on the event loop if it is awaitable
         Args:
-            folder_data: Dictionary containing folder information
+            event_type: Event name, used for error reporting
+            handler: Handler to call
+            data: Dictionary containing the event information
+        Returns:
+            The scheduled task for asynchronous handlers, otherwise None
         """
-        for handler in self.folder_created_handlers:
+        try:
+            result = handler(data)
+            if not inspect.isawaitable(result):
+                return None
+                
             try:
-                handler(folder_data)
-            except Exception as e:
-                logger.error(f"Error in folder created handler: {str(e)}")
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                caller_loop = _caller_loop.get()
+                if caller_loop is not None:
+                    # Called from an a* wrapper's worker thread, so hand the
+                    # handler to the loop awaiting the wrapper
+                    caller_loop.call_soon_threadsafe(self._schedule, caller_loop, event_type, result)
+                    return None
+                # Called from synchronous code, so run the handler to completion
+                asyncio.run(_as_coroutine(result))
+                return None
                 
-    def trigger_folder_updated(self, folder_data: Dict):
+            return self._schedule(loop, event_type, result)
+        except Exception as e:
+            logger.error(f"Error in {event_type.replace('_', ' ')} handler: {str(e)}")
+            return None
+            
+    def _schedule(self, loop: asyncio.AbstractEventLoop, event_type: str, awaitable: Awaitable) -> asyncio.Task:
+        """Run the awaitable returned by a handler as a task on the loop, which must be running in this thread"""
+        task = loop.create_task(_as_coroutine(awaitable))
+        self._tasks.add(task)
+        task.add_done_callback(partial(self._on_task_done, event_type))
+        return task
+            
+    def _on_task_done(self, event_type: str, task: asyncio.Task):
+        """Release a finished handler task and log its failure, if any"""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error in {event_type.replace('_', ' ')} handler: {str(task.exception())}")
+        
+    # Per-event shortcuts
+    on_folder_created = partialmethod(on, "folder_created")
+    on_folder_updated = partialmethod(on, "folder_updated")
+    on_document_created = partialmethod(on, "document_created")
+    on_document_updated = partialmethod(on, "document_updated")
+    trigger_folder_created = partialmethod(trigger, "folder_created")
+    trigger_folder_updated = partialmethod(trigger, "folder_updated")
+    trigger_document_created = partialmethod(trigger, "document_created")
+    trigger_document_updated = partialmethod(trigger, "document_updated")
+
+class _RateLimitRetry(Retry):
+    """
+    Retry policy that retries 429 responses for every HTTP method.
+    A rate-limited request was not processed, so resending a POST or PATCH
+    is safe; other statuses in status_forcelist are only retried for the
+    idempotent methods in allowed_methods.
+    """
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+class _Call(NamedTuple):
+    """
+    A prepared Slite request. Both clients send it over their own transport
+    and pass the response to finish, which checks it, fires any events and
+    builds the return value.
+    """
+    method: str
+    url: str
+    # Description of the operation used in error messages, e.g. "creating note"
+    action: str
+    finish: Callable
+    body: Union[bytes, _JSONStream, None] = None
+    params: Optional[Dict] = None
+    # Re-raise transport errors as "Network error"; when False every failure
+    # is logged and re-raised unchanged
+    wrap_network_errors: bool = True
+
+class SliteAPIBase:
+    """
+    Shared state and helpers for the Slite API clients.
+    Holds authentication, event handlers and the content conversion helpers
+    used by both the blocking and the asyncio clients.
+    """
+    
+    # Maximum number of converted documents kept in the ProseMirror cache
+    _PM_CACHE_SIZE = 65536
+    # Maximum number of converted lines kept in the per-line node cache
+    _LINE_CACHE_SIZE = 8192
+    # Maximum number of rendered meeting notes kept in the markdown cache
+    _MD_CACHE_SIZE = 256
+    # Notes whose text content is longer than this are uploaded as a chunked stream
+    _STREAM_MIN_SIZE = 1024 * 1024
+    # Markdown body of the special note that represents a folder
+    _FOLDER_MD_TMPL = "# {name}\n\n{description}\n\n---\nThis is a folder for organizing content.\n"
+    
+    def __init__(self, api_key: str):
         """
-        Trigger all registered folder update handlers
+        Initialize the Slite API client
         Args:
-            folder_data: Dictionary containing folder information
+            api_key: Slite API authentication key
         """
-        for handler in self.folder_updated_handlers:
-            try:
-                handler(folder_data)
-            except Exception as e:
-                logger.error(f"Error in folder updated handler: {str(e)}")
+        self.api_key = api_key
+        self.base_url = "https://api.slite.com"
+        # Fixed for the client's lifetime; sessions send them as defaults
+        self.headers = MappingProxyType({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+        self.events = SliteEventHandler()
+        # Converted ProseMirror documents keyed by hash(content), oldest first
+        self._pm_cache: OrderedDict[int, Tuple[str, Dict]] = OrderedDict()
+        # Per-line (kind, node) conversions shared across documents, oldest first
+        self._line_node_cache: OrderedDict[str, Tuple[str, Dict]] = OrderedDict()
+        # Rendered meeting notes markdown keyed by serialized notes data, oldest first
+        self._md_cache: OrderedDict[bytes, str] = OrderedDict()
+        # Guards the caches when one client is used from several threads
+        self._cache_lock = threading.Lock()
+
+    def add_metadata(self, data: Dict) -> Dict:
+        """
+        Add metadata to the data dictionary
+        Args:
+            data: Dictionary to add metadata to
+        Returns:
+            Dictionary with added metadata
+        """
+        if "metadata" not in data:
+            data["metadata"] = {}
+            
+        data["metadata"].update({
+            "last_updated": _now_str(),
+            "updated_by": "Slite Integration Agent"
+        })
+        return data
+
+    def _folder_markdown(self, name: str, description: str) -> str:
+        """
+        Build the markdown body of the note representing a folder
+        Args:
+            name: Name of the folder
+            description: Description for the folder
+        Returns:
+            Markdown string for the folder note
+        """
+        return self._FOLDER_MD_TMPL.format_map({"name": name, "description": description})
+
+    def _check(self, response, action: str, not_found_msg: Optional[str] = None):
+        """
+        Raise an exception unless the response is successful
+        Args:
+            response: Response returned by the HTTP session
+            action: Description of the operation, e.g. "creating note"
+            not_found_msg: Optional message to raise for a 404 response
+        Raises:
+            Exception: For any non-2xx response
+        """
+        status = response.status_code
+        if 200 <= status < 300:
+            return
+        if status == 404 and not_found_msg:
+            raise Exception(not_found_msg)
+        handler = _STATUS_HANDLERS.get(status)
+        if handler:
+            raise handler(response)
+        raise Exception(f"Error {action}: {response.text}")
+
+    def _encode_note_body(self, data: Dict, size: int) -> Union[bytes, _JSONStream]:
+        """
+        Encode the body of a note request. Notes whose text content is longer
+        than _STREAM_MIN_SIZE are streamed in chunks instead of being
+        serialized into a single bytes object.
+        Args:
+            data: Note payload holding a ProseMirror document under "content"
+            size: Length of the note's text content
+        Returns:
+            Encoded body, or a re-iterable chunked stream for large notes
+        """
+        if size > self._STREAM_MIN_SIZE:
+            return _JSONStream(data)
+        return orjson.dumps(data)
+
+    def _folder_call(self, name: str, description: str, folder_id: Optional[str] = None) -> _Call:
+        """
+        Prepare the request creating or updating a folder, sent as a note with special format
+        Args:
+            name: Name of the folder
+            description: Description for the folder
+            folder_id: ID of the folder to update, or None to create a new one
+        Returns:
+            Call resolving to the folder's information
+        """
+        if folder_id is None:
+            http_method, endpoint = "POST", f"{self.base_url}/v1/notes"
+            action, event_name = "creating folder", "folder_created"
+        else:
+            http_method, endpoint = "PUT", f"{self.base_url}/v1/notes/{folder_id}"
+            action, event_name = "updating folder", "folder_updated"
+            
+        data = {
+            "title": name,
+            "markdown": self._folder_markdown(name, description),
+            "isFolder": True
+        }
+        
+        # Add metadata
+        data = self.add_metadata(data)
+        
+        def finish(response) -> Dict:
+            self._check(response, action)
+            result = orjson.loads(response.content)
+            folder_data = {
+                "id": result.get("id"),
+                "name": name,
+                "description": description,
+                "url": result.get("url"),
+                "metadata": data.get("metadata", {})
+            }
+            self.events.trigger(event_name, folder_data)
+            return folder_data
+            
+        return _Call(http_method, endpoint, action, finish, orjson.dumps(data), wrap_network_errors=False)
+
+    def _document_call(self, title: str, markdown_content: str, folder_id: Optional[str] = None, doc_id: Optional[str] = None) -> _Call:
+        """
+        Prepare the request creating or updating a document
+        Args:
+            title: Title of the document
+            markdown_content: Markdown content of the document
+            folder_id: Optional ID of the folder holding the document
+            doc_id: ID of the document to update, or None to create a new one
+        Returns:
+            Call resolving to the document's information
+        """
+        if doc_id is None:
+            http_method, endpoint = "POST", f"{self.base_url}/v1/notes"
+            action, event_name = "creating document", "document_created"
+        else:
+            http_method, endpoint = "PUT", f"{self.base_url}/v1/notes/{doc_id}"
+            action, event_name = "updating document", "document_updated"
+            
+        data = {
+            "title": title,
+            "markdown": markdown_content
+        }
+        
+        if folder_id:
+            data["parentNoteId"] = folder_id
+            
+        # Add metadata
+        data = self.add_metadata(data)
+        
+        def finish(response) -> Dict:
+            self._check(response, action)
+            result = orjson.loads(response.content)
+            # Add our metadata to the result
+            result["metadata"] = data.get("metadata", {})
+            self.events.trigger(event_name, result)
+            return result
+            
+        return _Call(http_method, endpoint, action, finish, orjson.dumps(data), wrap_network_errors=False)
+
+    def _note_call(self, title: str, content: str, note_id: Optional[str] = None) -> _Call:
+        """
+        Prepare the request creating or updating a note
+        Args:
+            title: Title of the note
+            content: Plain text content, converted to ProseMirror format
+            note_id: ID of the note to update, or None to create a new one
+        Returns:
+            Call resolving to the note's information
+        """
+        # Convert content to ProseMirror format
+        document = self._convert_to_prosemirror(content)
+        
+        data = {
+            "title": title,
+            "content": document
+        }
+        
+        if note_id is None:
+            http_method, endpoint = "POST", f"{self.base_url}/v1/notes"
+            action, not_found_msg = "creating note", None
+            success_msg = "Successfully created note with content"
+            logger.debug(f"Creating note with title: {title}")
+            logger.debug(f"Content structure: {document}")
+        else:
+            http_method, endpoint = "PATCH", f"{self.base_url}/v1/notes/{note_id}"
+            action, not_found_msg = "updating note", f"Note {note_id} not found"
+            success_msg = f"Successfully updated note {note_id}"
+            logger.debug(f"Updating note {note_id}")
+            
+        def finish(response) -> Dict:
+            self._check(response, action, not_found_msg)
+            logger.info(success_msg)
+            return orjson.loads(response.content)
+            
+        return _Call(http_method, endpoint, action, finish, self._encode_note_body(data, len(content)))
+
+    def _get_note_call(self, note_id: str) -> _Call:
+        """Prepare the request fetching a note"""
+        def finish(response) -> Dict:
+            self._check(response, "getting note", f"Note {note_id} not found")
+            return orjson.loads(response.content)
+            
+        return _Call("GET", f"{self.base_url}/v1/notes/{note_id}", "getting note", finish)
+
+    def _search_notes_call(self, query: str) -> _Call:
+        """Prepare the request running a note search"""
+        def finish(response) -> List[Dict]:
+            self._check(response, "searching notes")
+            return orjson.loads(response.content)
+            
+        return _Call("GET", f"{self.base_url}/v1/notes/search", "searching notes", finish, params={"query": query})
+
+    def _delete_call(self, kind: str, item_id: str) -> _Call:
+        """
+        Prepare the request deleting a note, folder or document
+        Args:
+            kind: Kind of the item shown in messages, e.g. "Note"
+            item_id: ID of the item to delete
+        Returns:
+            Call resolving to the deletion result
+        """
+        action = f"deleting {kind.lower()}"
+        
+        def finish(response) -> Dict:
+            self._check(response, action, f"{kind} {item_id} not found")
+            return {"status": "success", "message": f"{kind} {item_id} deleted successfully"}
+            
+        return _Call("DELETE", f"{self.base_url}/v1/notes/{item_id}", action, finish)
+
+    def _convert_text_to_prosemirror_node(self, text: str) -> Dict:
+        """
+        Convert a text string to a ProseMirror text node
+        Args:
+            text: Text string to convert
+        Returns:
+            Dictionary representing the ProseMirror text node
+        """
+        return {
+            "type": "text",
+            "text": text
+        }
+
+    @staticmethod
+    def _flush(doc_content: List[Dict], current_list: Optional[Dict], current_paragraph: Optional[Dict]):
+        """
+        Append any open bullet list and paragraph blocks to the document
+        Args:
+            doc_content: Document content list to append to
+            current_list: Open bulletList node, if any
+            current_paragraph: Open paragraph node, if any
+        """
+        if current_list:
+            doc_content.append(current_list)
+        if current_paragraph:
+            doc_content.append(current_paragraph)
+
+    def _convert_to_prosemirror(self, content: str) -> Dict:
+        """
+        Convert content to ProseMirror format, reusing the result of a
+        previous conversion of identical content.
+        The returned document is shared with the cache and must be
+        treated as read-only.
+        Args:
+            content: Content string to convert
+        Returns:
+            Dictionary representing the ProseMirror content
+        """
+        key = hash(content)
+        with self._cache_lock:
+            cached = self._pm_cache.get(key)
+            # Compare the full content as well to guard against hash collisions
+            if cached is not None and cached[0] == content:
+                self._pm_cache.move_to_end(key)
+                return cached[1]
+            
+            doc = self._build_prosemirror(content)
+            self._pm_cache[key] = (content, doc)
+            self._pm_cache.move_to_end(key)
+            if len(self._pm_cache) > self._PM_CACHE_SIZE:
+                self._pm_cache.popitem(last=False)
+            return doc
+
+    def _line_to_node(self, line: str) -> Tuple[str, Dict]:
+        """
+        Classify a single content line and build its ProseMirror node
+        Args:
+            line: Raw content line
+        Returns:
+            Tuple of the line kind and its node: an empty paragraph for
+            blank lines, a listItem for bullets, a heading for section
+            headers and a text node for regular text
+        """
+        line = line.rstrip()
+        
+        if not line:
+            return _LINE_BLANK, _EMPTY_PARAGRAPH
+        
+        stripped = line.lstrip()
+        
+        # Handle bullet points
+        if stripped.startswith('- '):
+            paragraph = _PARAGRAPH_TEMPLATE.copy()
+            paragraph["content"] = [{"type": "text", "text": stripped[2:]}]
+            list_item = _LIST_ITEM_TEMPLATE.copy()
+            list_item["content"] = [paragraph]
+            return _LINE_BULLET, list_item
+        
+        # Handle section headers and numbered sections
+        if line.startswith(_HEADER_PREFIXES) or (len(line) >= 2 and line[0].isdigit() and line[1] == '.'):
+            heading = _HEADING_TEMPLATE.copy()
+            heading["content"] = [{"type": "text", "text": line}]
+            return _LINE_HEADING, heading
+        
+        # Regular text
+        return _LINE_TEXT, {"type": "text", "text": line}
+
+    def _build_prosemirror(self, content: str) -> Dict:
+        """
+        Build the ProseMirror document for a content string.
+        Line nodes come from a per-line cache, so an edit only converts
+        the lines that changed; grouping bullets into lists and text into
+        paragraphs happens here.
+        Args:
+            content: Content string to convert
+        Returns:
+            Dictionary representing the ProseMirror content
+        """
+        line_cache = self._line_node_cache
+        doc_content = []
+        
+        current_list = None
+        current_paragraph = None
+        
+        for line in content.split('\n'):
+            entry = line_cache.get(line)
+            if entry is None:
+                entry = line_cache[line] = self._line_to_node(line)
+                if len(line_cache) > self._LINE_CACHE_SIZE:
+                    line_cache.popitem(last=False)
+            else:
+                line_cache.move_to_end(line)
+            kind, node = entry
+            
+            if kind == _LINE_BULLET:
+                if current_paragraph:
+                    doc_content.append(current_paragraph)
+                    current_paragraph = None
+                if current_list is None:
+                    current_list = _BULLET_LIST_TEMPLATE.copy()
+                    current_list["content"] = []
+                current_list["content"].append(node)
+                
+            elif kind == _LINE_TEXT:
+                if current_list:
+                    doc_content.append(current_list)
+                    current_list = None
+                if current_paragraph is None:
+                    current_paragraph = _PARAGRAPH_TEMPLATE.copy()
+                    current_paragraph["content"] = []
+                current_paragraph["content"].append(node)
                 
-    def trigger_document_created(self, document_data: Dict):
+            # Blank lines and headings close any open block
+            else:
+                self._flush(doc_content, current_list, current_paragraph)
+                current_list = current_paragraph = None
+                doc_content.append(node)
+        
+        # Add any remaining content
+        self._flush(doc_content, current_list, current_paragraph)
+            
+        return {
+            "type": "doc",
+            "content": doc_content
+        }
+
+    def format_meeting_notes_markdown(self, notes_data: dict) -> str:
+        """
+        Format meeting notes as markdown, reusing the rendering of
+        previously formatted identical notes data
+        Args:
+            notes_data: Dictionary containing meeting notes data
+        Returns:
+            Markdown string representing the meeting notes
+        """
+        try:
+            key = orjson.dumps(notes_data, option=_MD_KEY_OPTIONS)
+        except TypeError:
+            # Data that is not plain JSON is rendered without caching
+            return "\n".join(self._iter_md(notes_data))
+        if _contains_enum(notes_data):
+            # Enums serialize to their value but render by name
+            return "\n".join(self._iter_md(notes_data))
+        
+        with self._cache_lock:
+            cached = self._md_cache.get(key)
+            if cached is not None:
+                self._md_cache.move_to_end(key)
+                return cached
+            
+            markdown = self._md_cache[key] = "\n".join(self._iter_md(notes_data))
+            if len(self._md_cache) > self._MD_CACHE_SIZE:
+                self._md_cache.popitem(last=False)
+            return markdown
+
+    def _iter_md(self, notes_data: dict) -> Iterator[str]:
+        """
+        Yield the markdown lines for meeting notes data
+        Args:
+            notes_data: Dictionary containing meeting notes data
+        Returns:
+            Iterator over the markdown lines, to be joined with newlines
+        """
+        # Add metadata
+        metadata = notes_data.get("metadata", {})
+        yield "# Meeting Details\n"
+        yield f"**Date:** {metadata.get('date', 'N/A')}"
+        yield f"**Time:** {metadata.get('time', 'N/A')}"
+        yield f"**Attendees:** {metadata.get('attendees_count', 0)} attendees"
+        yield f"**Facilitator:** {metadata.get('facilitator', 'N/A')}\n"
+        
+        # Add sections
+        for section in notes_data.get("sections", []):
+            yield f"# {section.get('title', 'Untitled Section')}"
+            
+            for item in section.get("content", []):
+                if item.get("subtitle"):
+                    yield f"## {item['subtitle']}"
+                
+                details = item.get("details", "")
+                if isinstance(details, list):
+                    for detail in details:
+                        yield f"- {detail}"
+                else:
+                    yield details
+                
+            yield ""  # Add empty line between sections
+
+class SliteAPI(SliteAPIBase):
+    """
+    Main class for interacting with the Slite API.
+    Provides methods for creating, updating, and managing documents and folders.
+    """
+    
+    def __init__(self, api_key: str, max_workers: int = 8, max_retries: int = 5):
+        """
+        Initialize the Slite API client
+        Args:
+            api_key: Slite API authentication key
+            max_workers: Number of threads running the a* coroutine wrappers
+            max_retries: Number of times a failed request is retried after the
+                first attempt, as in AsyncSliteAPI
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        super().__init__(api_key)
+        # Reuse keep-alive connections across calls and retry rate-limited
+        # requests or failed idempotent ones, honouring Retry-After
+        retry = _RateLimitRetry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=100, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self.headers)
+        # Runs blocking calls for the a* wrappers when used from async code
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def close(self):
+        """Close the underlying HTTP session and the wrappers' thread pool"""
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    async def _arun(self, func: Callable, *args):
+        """
+        Run a blocking client method on the client's thread pool.
+        Coroutine event handlers fired by the call run on the calling loop.
+        Args:
+            func: Blocking method to call
+            args: Positional arguments for the call
+        Returns:
+            The method's return value
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        context.run(_caller_loop.set, loop)
+        return await loop.run_in_executor(self._executor, partial(context.run, func, *args))
+
+    async def acreate_folder(self, name: str, description: str = "") -> Dict:
+        """Run create_folder on the thread pool without blocking the event loop"""
+        return await self._arun(self.create_folder, name, description)
+
+    async def acreate_document(self, title: str, markdown_content: str, folder_id: Optional[str] = None) -> Dict:
+        """Run create_document on the thread pool without blocking the event loop"""
+        return await self._arun(self.create_document, title, markdown_content, folder_id)
+
+    async def acreate_note(self, title: str, content: str) -> Dict:
+        """Run create_note on the thread pool without blocking the event loop"""
+        return await self._arun(self.create_note, title, content)
+
+    async def aupdate_note(self, note_id: str, title: str, content: str) -> Dict:
+        """Run update_note on the thread pool without blocking the event loop"""
+        return await self._arun(self.update_note, note_id, title, content)
+
+    async def aget_note(self, note_id: str) -> Dict:
+        """Run get_note on the thread pool without blocking the event loop"""
+        return await self._arun(self.get_note, note_id)
+
+    async def asearch_notes(self, query: str) -> List[Dict]:
+        """Run search_notes on the thread pool without blocking the event loop"""
+        return await self._arun(self.search_notes, query)
+
+    async def adelete_note(self, note_id: str) -> Dict:
+        """Run delete_note on the thread pool without blocking the event loop"""
+        return await self._arun(self.delete_note, note_id)
+
+    async def aupdate_folder(self, folder_id: str, name: str, description: str = "") -> Dict:
+        """Run update_folder on the thread pool without blocking the event loop"""
+        return await self._arun(self.update_folder, folder_id, name, description)
+
+    async def adelete_folder(self, folder_id: str) -> Dict:
+        """Run delete_folder on the thread pool without blocking the event loop"""
+        return await self._arun(self.delete_folder, folder_id)
+
+    async def aupdate_document(self, doc_id: str, title: str, markdown_content: str, folder_id: Optional[str] = None) -> Dict:
+        """Run update_document on the thread pool without blocking the event loop"""
+        return await self._arun(self.update_document, doc_id, title, markdown_content, folder_id)
+
+    async def adelete_document(self, doc_id: str) -> Dict:
+        """Run delete_document on the thread pool without blocking the event loop"""
+        return await self._arun(self.delete_document, doc_id)
+
+    def _execute(self, call: _Call):
+        """
+        Send a prepared call over the session
+        Args:
+            call: Request and response handling built by SliteAPIBase
+        Returns:
+            The call's result
+        """
+        try:
+            response = self.session.request(call.method, call.url, data=call.body, params=call.params)
+            return call.finish(response)
+                
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error {call.action}: {str(e)}")
+            if call.wrap_network_errors:
+                raise Exception(f"Network error: {str(e)}")
+            raise
+        except Exception as e:
+            if not call.wrap_network_errors:
+                logger.error(f"Error {call.action}: {str(e)}")
+            raise
+
+    def create_folder(self, name: str, description: str = "") -> Dict:
+        """
+        Create a new folder in Slite by creating a special note
+        Args:
+            name: Name of the folder to create
+            description: Optional description for the folder
+        Returns:
+            Dictionary containing the created folder's information
+        """
+        return self._execute(self._folder_call(name, description))
+
+    def create_document(self, title: str, markdown_content: str, folder_id: Optional[str] = None) -> Dict:
+        """
+        Create a new document in Slite
+        Args:
+            title: Title of the document to create
+            markdown_content: Markdown content of the document
+            folder_id: Optional ID of the folder to create the document in
+        Returns:
+            Dictionary containing the created document's information
+        """
+        return self._execute(self._document_call(title, markdown_content, folder_id))
+
+    def create_note(self, title: str, content: str) -> Dict:
+        """
+        Create a new note in Slite
+        Args:
+            title: Title of the note to create
+            content: Content of the note to create
+        Returns:
+            Dictionary containing the created note's information
+        """
+        return self._execute(self._note_call(title, content))
+
+    def update_note(self, note_id: str, title: str, content: str) -> Dict:
+        """
+        Update an existing note in Slite
+        Args:
+            note_id: ID of the note to update
+            title: New title of the note
+            content: New content of the note
+        Returns:
+            Dictionary containing the updated note's information
+        """
+        return self._execute(self._note_call(title, content, note_id))
+
+    def get_note(self, note_id: str) -> Dict:
         """
-        Trigger all registered document creation handlers
+        Get a note from Slite
         Args:
-            document_data: Dictionary containing document information
+            note_id: ID of the note to retrieve
+        Returns:
+            Dictionary containing the note's information
+        """
+        return self._execute(self._get_note_call(note_id))
+
+    def search_notes(self, query: str) -> List[Dict]:
+        """
+        Search for notes in Slite
+        Args:
+            query: Search query to use
+        Returns:
+            List of dictionaries containing the search results
+        """
+        return self._execute(self._search_notes_call(query))
+
+    def delete_note(self, note_id: str) -> Dict:
+        """
+        Delete a note from Slite
+        Args:
+            note_id: ID of the note to delete
+        Returns:
+            Dictionary containing the deletion result
+        """
+        return self._execute(self._delete_call("Note", note_id))
+
+    def update_folder(self, folder_id: str, name: str, description: str = "") -> Dict:
+        """
+        Update an existing folder in Slite
+        Args:
+            folder_id: ID of the folder to update
+            name: New name of the folder
+            description: Optional new description of the folder
+        Returns:
+            Dictionary containing the updated folder's information
+        """
+        return self._execute(self._folder_call(name, description, folder_id))
+
+    def delete_folder(self, folder_id: str) -> Dict:
+        """
+        Delete a folder from Slite
+        Args:
+            folder_id: ID of the folder to delete
+        Returns:
+            Dictionary containing the deletion result
+        """
+        return self._execute(self._delete_call("Folder", folder_id))
+
+    def update_document(self, doc_id: str, title: str, markdown_content: str, folder_id: Optional[str] = None) -> Dict:
+        """
+        Update an existing document in Slite
+        Args:
+            doc_id: ID of the document to update
+            title: New title of the document
+            markdown_content: New markdown content of the document
+            folder_id: Optional ID of the folder to update the document in
+        Returns:
+            Dictionary containing the updated document's information
         """
-        for handler in self.document_created_handlers:
-            try:
-                handler(document_data)
-            except Exception as e:
-                logger.error(f"Error in document created handler: {str(e)}")
-                
-    def trigger_document_updated(self, document_data: Dict):
+        return self._execute(self._document_call(title, markdown_content, folder_id, doc_id))
+
+    def delete_document(self, doc_id: str) -> Dict:
         """
-        Trigger all registered document update handlers
+        Delete a document from Slite
         Args:
-            document_data: Dictionary containing document information
+            doc_id: ID of the document to delete
+        Returns:
+            Dictionary containing the deletion result
         """
-        for handler in self.document_updated_handlers:
-            try:
-                handler(document_data)
-            except Exception as e:
-                logger.error(f"Error in document updated handler: {str(e)}")
+        return self._execute(self._delete_call("Document", doc_id))
 
-class SliteAPI:
+class AsyncSliteAPI(SliteAPIBase):
     """
-    Main class for interacting with the Slite API.
-    Provides methods for creating, updating, and managing documents and folders.
+    Asyncio client for the Slite API.
+    Mirrors the SliteAPI methods as coroutines on top of a single pooled
+    httpx.AsyncClient, so independent calls can be awaited concurrently:
+
+        async with AsyncSliteAPI(api_key) as slite:
+            docs = await asyncio.gather(*[
+                slite.create_document(title, body, folder_id)
+                for title, body in items
+            ])
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, concurrency: int = 10, max_retries: int = 5):
         """
-        Initialize the Slite API client
+        Initialize the asyncio Slite API client
         Args:
             api_key: Slite API authentication key
+            concurrency: Maximum number of requests in flight at once
+            max_retries: Number of times a rate-limited request is retried after
+                the first attempt, as in SliteAPI
         """
-        self.api_key = api_key
-        self.base_url = "https://api.slite.com"
-        self.headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        self.events = SliteEventHandler()
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        super().__init__(api_key)
+        self.max_retries = max_retries
+        self._session = httpx.AsyncClient(
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=10)
+        )
+        self._sem = asyncio.Semaphore(concurrency)
+        # Pending read calls shared by concurrent callers, see _collapse
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
 
-    def add_metadata(self, data: Dict) -> Dict:
+    async def close(self):
+        """Close the underlying HTTP session and release pooled connections"""
+        await self._session.aclose()
+
+    def _encode_note_body(self, data: Dict, size: int) -> Union[bytes, _AsyncJSONStream]:
+        """Encode the body of a note request, wrapping streams for httpx.AsyncClient"""
+        body = super()._encode_note_body(data, size)
+        if isinstance(body, _JSONStream):
+            return _AsyncJSONStream(body)
+        return body
+
+    async def __aenter__(self) -> "AsyncSliteAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _collapse(self, key: Tuple[str, str], fetch: Callable):
         """
-        Add metadata to the data dictionary
+        Share one in-flight call between concurrent callers with the same key.
+        The call runs as its own task, so cancelling any caller, including
+        the one that started it, leaves the call running for the others.
         Args:
-            data: Dictionary to add metadata to
+            key: Operation name and argument identifying the call
+            fetch: Zero-argument coroutine function performing the call
         Returns:
-            Dictionary with added metadata
+            The result of the shared call
         """
-        if "metadata" not in data:
-            data["metadata"] = {}
-            
-        data["metadata"].update({
-            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "updated_by": "Slite Integration Agent"
-        })
-        return data
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._release_inflight, key))
+        # Shield so a cancelled caller does not cancel the shared call
+        return await asyncio.shield(task)
 
-    def _convert_text_to_prosemirror_node(self, text: str) -> Dict:
+    def _release_inflight(self, key: Tuple[str, str], task: asyncio.Task):
+        """Forget a finished shared call so later callers start a new one"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved when every caller has been cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
         """
-        Convert a text string to a ProseMirror text node
+        Send a request, retrying rate-limited responses with exponential
+        backoff and jitter. Retry-After is honoured when the server sends it.
         Args:
-            text: Text string to convert
+            method: HTTP method to use
+            url: URL to send the request to
+            kwargs: Extra arguments passed to httpx.AsyncClient.request
         Returns:
-            Dictionary representing the ProseMirror text node
+            The first response that is not a 429
+        Raises:
+            Exception: If the request is still rate limited after max_retries retries
         """
-        return {
-            "type": "text",
-            "text": text
-        }
+        for attempt in range(self.max_retries + 1):
+            async with self._sem:
+                response = await self._session.request(method, url, **kwargs)
+            
+            if response.status_code != 429:
+                return response
+            if attempt == self.max_retries:
+                break
+                
+            try:
+                delay = float(response.headers.get("Retry-After", 2 ** attempt))
+            except ValueError:
+                delay = 2 ** attempt
+            delay += random.uniform(0, 1)
+            logger.warning(f"Rate limit exceeded for {method} {url}, retrying in {delay:.1f} seconds")
+            await asyncio.sleep(delay)
+            
+        raise Exception("Rate limit exceeded")
 
-    def _convert_to_prosemirror(self, content: str) -> Dict:
+    async def _execute(self, call: _Call):
         """
-        Convert content to ProseMirror format
+        Send a prepared call through _request
         Args:
-            content: Content string to convert
+            call: Request and response handling built by SliteAPIBase
         Returns:
-            Dictionary representing the ProseMirror content
+            The call's result
         """
-        lines = content.split('\n')
-        doc_content = []
-        
-        current_list = None
-        current_section = None
-        current_paragraph = None
-        
-        for line in lines:
-            line = line.rstrip()
-            
-            # Skip empty lines
-            if not line:
-                if current_list:
-                    doc_content.append(current_list)
-                    current_list = None
-                if current_paragraph:
-                    doc_content.append(current_paragraph)
-                doc_content.append({
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": ""}]
-                })
-                continue
-            
-            # Handle bullet points
-            if line.strip().startswith('- '):
-                text = line.strip()[2:]
-                if current_list is None:
-                    current_list = {
-                        "type": "bulletList",
-                        "content": []
-                    }
-                list_item = {
-                    "type": "listItem",
-                    "content": [{
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": text}]
-                    }]
-                }
-                current_list["content"].append(list_item)
-                
-            # Handle section headers
-            elif line.startswith('Meeting Notes:') or line.startswith('Date:') or line.startswith('Time:') or line.startswith('Attendees:') or line.startswith('Facilitator:'):
-                if current_list:
-                    doc_content.append(current_list)
-                    current_list = None
-                if current_paragraph:
-                    doc_content.append(current_paragraph)
-                    current_paragraph = None
-                    
-                doc_content.append({
-                    "type": "heading",
-                    "attrs": {"level": 2},
-                    "content": [{"type": "text", "text": line}]
-                })
-                
-            # Handle numbered sections
-            elif line[0].isdigit() and line[1] == '.':
-                if current_list:
-                    doc_content.append(current_list)
-                    current_list = None
-                if current_paragraph:
-                    doc_content.append(current_paragraph)
-                    current_paragraph = None
-                    
-                doc_content.append({
-                    "type": "heading",
-                    "attrs": {"level": 2},
-                    "content": [{"type": "text", "text": line}]
-                })
+        try:
+            response = await self._request(call.method, call.url, content=call.body, params=call.params)
+            return call.finish(response)
                 
-            # Regular text
-            else:
-                if current_list:
-                    doc_content.append(current_list)
-                    current_list = None
-                    
-                if not current_paragraph:
-                    current_paragraph = {
-                        "type": "paragraph",
-                        "content": []
-                    }
-                current_paragraph["content"].append({
-                    "type": "text", 
-                    "text": line
-                })
-        
-        # Add any remaining content
-        if current_list:
-            doc_content.append(current_list)
-        if current_paragraph:
-            doc_content.append(current_paragraph)
-            
-        return {
-            "type": "doc",
-            "content": doc_content
-        }
+        except httpx.HTTPError as e:
+            logger.error(f"Error {call.action}: {str(e)}")
+            if call.wrap_network_errors:
+                raise Exception(f"Network error: {str(e)}")
+            raise
+        except Exception as e:
+            if not call.wrap_network_errors:
+                logger.error(f"Error {call.action}: {str(e)}")
+            raise
 
-    def create_folder(self, name: str, description: str = "") -> Dict:
+    async def create_folder(self, name: str, description: str = "") -> Dict:
         """
         Create a new folder in Slite by creating a special note
         Args:
@@ -256,54 +1181,9 @@ class SliteAPI:
         Returns:
             Dictionary containing the created folder's information
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes"
-            
-            # Create a folder using note with special format
-            markdown_content = f"""# {name}
-
-{description}
-
----
-This is a folder for organizing content.
-"""
-            
-            data = {
-                "title": name,
-                "markdown": markdown_content,
-                "isFolder": True
-            }
-            
-            # Add metadata
-            data = self.add_metadata(data)
-            
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=data
-            )
-            
-            if response.status_code in [200, 201]:
-                result = response.json()
-                folder_data = {
-                    "id": result.get("id"),
-                    "name": name,
-                    "description": description,
-                    "url": result.get("url"),
-                    "metadata": data.get("metadata", {})
-                }
-                # Trigger folder created event
-                self.events.trigger_folder_created(folder_data)
-                return folder_data
-            else:
-                logger.error(f"Error creating folder: {response.text}")
-                response.raise_for_status()
-                
-        except Exception as e:
-            logger.error(f"Error creating folder: {str(e)}")
-            raise
+        return await self._execute(self._folder_call(name, description))
 
-    def create_document(self, title: str, markdown_content: str, folder_id: Optional[str] = None) -> Dict:
+    async def create_document(self, title: str, markdown_content: str, folder_id: Optional[str] = None) -> Dict:
         """
         Create a new document in Slite
         Args:
@@ -313,78 +1193,39 @@ This is a folder for organizing content.
         Returns:
             Dictionary containing the created document's information
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes"
-            data = {
-                "title": title,
-                "markdown": markdown_content
-            }
-            
-            if folder_id:
-                data["parentNoteId"] = folder_id
-                
-            # Add metadata
-            data = self.add_metadata(data)
-            
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=data
-            )
-            
-            if response.status_code in [200, 201]:
-                result = response.json()
-                # Add our metadata to the result
-                result["metadata"] = data.get("metadata", {})
-                # Trigger document created event
-                self.events.trigger_document_created(result)
-                return result
-            else:
-                logger.error(f"Error creating document: {response.text}")
-                response.raise_for_status()
-                
-        except Exception as e:
-            logger.error(f"Error creating document: {str(e)}")
-            raise
+        return await self._execute(self._document_call(title, markdown_content, folder_id))
 
-    def format_meeting_notes_markdown(self, notes_data: dict) -> str:
+    async def create_documents_bulk(self, folder_id: Optional[str], items: List[Tuple[str, str]], concurrency: int = 5) -> List[Dict]:
         """
-        Format meeting notes as markdown
+        Create several documents in a folder concurrently
         Args:
-            notes_data: Dictionary containing meeting notes data
+            folder_id: Optional ID of the folder to create the documents in
+            items: (title, markdown_content) pairs of the documents to create
+            concurrency: Maximum number of documents created at once
         Returns:
-            Markdown string representing the meeting notes
+            One result per item, in order: {"status": "success", "document": ...}
+            or {"status": "error", "title": ..., "message": ...}
         """
-        markdown = []
-        
-        # Add metadata
-        metadata = notes_data.get("metadata", {})
-        markdown.append("# Meeting Details\n")
-        markdown.append(f"**Date:** {metadata.get('date', 'N/A')}")
-        markdown.append(f"**Time:** {metadata.get('time', 'N/A')}")
-        markdown.append(f"**Attendees:** {metadata.get('attendees_count', 0)} attendees")
-        markdown.append(f"**Facilitator:** {metadata.get('facilitator', 'N/A')}\n")
+        sem = asyncio.Semaphore(concurrency)
         
-        # Add sections
-        for section in notes_data.get("sections", []):
-            markdown.append(f"# {section.get('title', 'Untitled Section')}")
-            
-            for item in section.get("content", []):
-                if item.get("subtitle"):
-                    markdown.append(f"## {item['subtitle']}")
-                
-                details = item.get("details", "")
-                if isinstance(details, list):
-                    for detail in details:
-                        markdown.append(f"- {detail}")
-                else:
-                    markdown.append(details)
+        async def create_one(title: str, markdown_content: str) -> Dict:
+            async with sem:
+                return await self.create_document(title, markdown_content, folder_id)
                 
-            markdown.append("")  # Add empty line between sections
+        results = await asyncio.gather(
+            *[create_one(title, markdown_content) for title, markdown_content in items],
+            return_exceptions=True
+        )
         
-        return "\n".join(markdown)
+        statuses = []
+        for (title, _), result in zip(items, results):
+            if isinstance(result, BaseException):
+                statuses.append({"status": "error", "title": title, "message": str(result)})
+            else:
+                statuses.append({"status": "success", "document": result})
+        return statuses
 
-    def create_note(self, title: str, content: str) -> Dict:
+    async def create_note(self, title: str, content: str) -> Dict:
         """
         Create a new note in Slite
         Args:
@@ -393,42 +1234,9 @@ This is a folder for organizing content.
         Returns:
             Dictionary containing the created note's information
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes"
-            
-            # Convert content to ProseMirror format
-            content = self._convert_to_prosemirror(content)
-            
-            data = {
-                "title": title,
-                "content": content
-            }
-            
-            logger.debug(f"Creating note with title: {title}")
-            logger.debug(f"Content structure: {content}")
-            
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=data
-            )
-            
-            if response.status_code in [200, 201]:
-                logger.info(f"Successfully created note with content")
-                return response.json()
-            elif response.status_code == 429:
-                raise Exception("Rate limit exceeded")
-            elif response.status_code == 401:
-                raise Exception("Invalid API key")
-            else:
-                logger.error(f"Error creating note: {response.text}")
-                raise Exception(f"Error creating note: {response.text}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error creating note: {str(e)}")
-            raise Exception(f"Network error: {str(e)}")
+        return await self._execute(self._note_call(title, content))
 
-    def update_note(self, note_id: str, title: str, content: str) -> Dict:
+    async def update_note(self, note_id: str, title: str, content: str) -> Dict:
         """
         Update an existing note in Slite
         Args:
@@ -438,93 +1246,31 @@ This is a folder for organizing content.
         Returns:
             Dictionary containing the updated note's information
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes/{note_id}"
-            
-            # Convert content to ProseMirror format
-            content = self._convert_to_prosemirror(content)
-            
-            data = {
-                "title": title,
-                "content": content
-            }
-            
-            logger.debug(f"Updating note {note_id}")
-            response = requests.patch(
-                endpoint,
-                headers=self.headers,
-                json=data
-            )
-            
-            if response.status_code == 200:
-                logger.info(f"Successfully updated note {note_id}")
-                return response.json()
-            elif response.status_code == 429:
-                raise Exception("Rate limit exceeded")
-            elif response.status_code == 401:
-                raise Exception("Invalid API key")
-            elif response.status_code == 404:
-                raise Exception(f"Note {note_id} not found")
-            else:
-                raise Exception(f"Error updating note: {response.text}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error updating note: {str(e)}")
-            raise Exception(f"Network error: {str(e)}")
+        return await self._execute(self._note_call(title, content, note_id))
 
-    def get_note(self, note_id: str) -> Dict:
+    async def get_note(self, note_id: str) -> Dict:
         """
-        Get a note from Slite
+        Get a note from Slite. Concurrent calls for the same note share a
+        single request and receive the same dictionary.
         Args:
             note_id: ID of the note to retrieve
         Returns:
             Dictionary containing the note's information
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes/{note_id}"
-            response = requests.get(endpoint, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                raise Exception("Rate limit exceeded")
-            elif response.status_code == 401:
-                raise Exception("Invalid API key")
-            elif response.status_code == 404:
-                raise Exception(f"Note {note_id} not found")
-            else:
-                raise Exception(f"Error getting note: {response.text}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error getting note: {str(e)}")
-            raise Exception(f"Network error: {str(e)}")
+        return await self._collapse(("get_note", note_id), lambda: self._execute(self._get_note_call(note_id)))
 
-    def search_notes(self, query: str) -> List[Dict]:
+    async def search_notes(self, query: str) -> List[Dict]:
         """
-        Search for notes in Slite
+        Search for notes in Slite. Concurrent calls with the same query share
+        a single request and receive the same results list.
         Args:
             query: Search query to use
         Returns:
             List of dictionaries containing the search results
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes/search"
-            response = requests.get(endpoint, headers=self.headers, params={"query": query})
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                raise Exception("Rate limit exceeded")
-            elif response.status_code == 401:
-                raise Exception("Invalid API key")
-            else:
-                raise Exception(f"Error searching notes: {response.text}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error searching notes: {str(e)}")
-            raise Exception(f"Network error: {str(e)}")
+        return await self._collapse(("search_notes", query), lambda: self._execute(self._search_notes_call(query)))
 
-    def delete_note(self, note_id: str) -> Dict:
+    async def delete_note(self, note_id: str) -> Dict:
         """
         Delete a note from Slite
         Args:
@@ -532,26 +1278,9 @@ This is a folder for organizing content.
         Returns:
             Dictionary containing the deletion result
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes/{note_id}"
-            response = requests.delete(endpoint, headers=self.headers)
-            
-            if response.status_code == 204:
-                return {"status": "success", "message": f"Note {note_id} deleted successfully"}
-            elif response.status_code == 429:
-                raise Exception("Rate limit exceeded")
-            elif response.status_code == 401:
-                raise Exception("Invalid API key")
-            elif response.status_code == 404:
-                raise Exception(f"Note {note_id} not found")
-            else:
-                raise Exception(f"Error deleting note: {response.text}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error deleting note: {str(e)}")
-            raise Exception(f"Network error: {str(e)}")
+        return await self._execute(self._delete_call("Note", note_id))
 
-    def update_folder(self, folder_id: str, name: str, description: str = "") -> Dict:
+    async def update_folder(self, folder_id: str, name: str, description: str = "") -> Dict:
         """
         Update an existing folder in Slite
         Args:
@@ -561,54 +1290,9 @@ This is a folder for organizing content.
         Returns:
             Dictionary containing the updated folder's information
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes/{folder_id}"
-            
-            # Update folder using note with special format
-            markdown_content = f"""# {name}
-
-{description}
-
----
-This is a folder for organizing content.
-"""
-            
-            data = {
-                "title": name,
-                "markdown": markdown_content,
-                "isFolder": True
-            }
-            
-            # Add metadata
-            data = self.add_metadata(data)
-            
-            response = requests.put(
-                endpoint,
-                headers=self.headers,
-                json=data
-            )
-            
-            if response.status_code in [200, 201]:
-                result = response.json()
-                folder_data = {
-                    "id": result.get("id"),
-                    "name": name,
-                    "description": description,
-                    "url": result.get("url"),
-                    "metadata": data.get("metadata", {})
-                }
-                # Trigger folder updated event
-                self.events.trigger_folder_updated(folder_data)
-                return folder_data
-            else:
-                logger.error(f"Error updating folder: {response.text}")
-                response.raise_for_status()
-                
-        except Exception as e:
-            logger.error(f"Error updating folder: {str(e)}")
-            raise
+        return await self._execute(self._folder_call(name, description, folder_id))
 
-    def delete_folder(self, folder_id: str) -> Dict:
+    async def delete_folder(self, folder_id: str) -> Dict:
         """
         Delete a folder from Slite
         Args:
@@ -616,26 +1300,9 @@ This is a folder for organizing content.
         Returns:
             Dictionary containing the deletion result
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes/{folder_id}"
-            response = requests.delete(endpoint, headers=self.headers)
-            
-            if response.status_code == 204:
-                return {"status": "success", "message": f"Folder {folder_id} deleted successfully"}
-            elif response.status_code == 429:
-                raise Exception("Rate limit exceeded")
-            elif response.status_code == 401:
-                raise Exception("Invalid API key")
-            elif response.status_code == 404:
-                raise Exception(f"Folder {folder_id} not found")
-            else:
-                raise Exception(f"Error deleting folder: {response.text}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error deleting folder: {str(e)}")
-            raise Exception(f"Network error: {str(e)}")
+        return await self._execute(self._delete_call("Folder", folder_id))
 
-    def update_document(self, doc_id: str, title: str, markdown_content: str, folder_id: Optional[str] = None) -> Dict:
+    async def update_document(self, doc_id: str, title: str, markdown_content: str, folder_id: Optional[str] = None) -> Dict:
         """
         Update an existing document in Slite
         Args:
@@ -646,41 +1313,9 @@ This is a folder for organizing content.
         Returns:
             Dictionary containing the updated document's information
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes/{doc_id}"
-            data = {
-                "title": title,
-                "markdown": markdown_content
-            }
-            
-            if folder_id:
-                data["parentNoteId"] = folder_id
-                
-            # Add metadata
-            data = self.add_metadata(data)
-            
-            response = requests.put(
-                endpoint,
-                headers=self.headers,
-                json=data
-            )
-            
-            if response.status_code in [200, 201]:
-                result = response.json()
-                # Add our metadata to the result
-                result["metadata"] = data.get("metadata", {})
-                # Trigger document updated event
-                self.events.trigger_document_updated(result)
-                return result
-            else:
-                logger.error(f"Error updating document: {response.text}")
-                response.raise_for_status()
-                
-        except Exception as e:
-            logger.error(f"Error updating document: {str(e)}")
-            raise
+        return await self._execute(self._document_call(title, markdown_content, folder_id, doc_id))
 
-    def delete_document(self, doc_id: str) -> Dict:
+    async def delete_document(self, doc_id: str) -> Dict:
         """
         Delete a document from Slite
         Args:
@@ -688,24 +1323,115 @@ This is a folder for organizing content.
         Returns:
             Dictionary containing the deletion result
         """
-        try:
-            endpoint = f"{self.base_url}/v1/notes/{doc_id}"
-            response = requests.delete(endpoint, headers=self.headers)
+        return await self._execute(self._delete_call("Document", doc_id))
+
+class BatchedSliteAPI:
+    """
+    Request collapser for bursts of document operations.
+    Calls are buffered per operation and flushed together once either
+    timeout_millis has elapsed since the first buffered call or
+    max_queue_length calls are waiting. Slite has no multi-operation
+    endpoint, so a flush runs the buffered calls concurrently over the
+    wrapped client's pooled connections. Each call returns a future that
+    resolves to that call's own result or exception.
+    """
+    
+    def __init__(self, api: AsyncSliteAPI, timeout_millis: int = 100, max_queue_length: int = 32):
+        """
+        Initialize the request collapser
+        Args:
+            api: Asyncio Slite client used to send the buffered calls
+            timeout_millis: Maximum time a call waits in the buffer
+            max_queue_length: Number of buffered calls that triggers an immediate flush
+        """
+        self.api = api
+        self.timeout_millis = timeout_millis
+        self.max_queue_length = max_queue_length
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+
+    async def __aenter__(self) -> "BatchedSliteAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def create_document(self, title: str, markdown_content: str, folder_id: Optional[str] = None) -> asyncio.Future:
+        """Queue a document creation; the future resolves to the created document"""
+        return self._enqueue("create_document", title, markdown_content, folder_id)
+
+    def update_document(self, doc_id: str, title: str, markdown_content: str, folder_id: Optional[str] = None) -> asyncio.Future:
+        """Queue a document update; the future resolves to the updated document"""
+        return self._enqueue("update_document", doc_id, title, markdown_content, folder_id)
+
+    def delete_document(self, doc_id: str) -> asyncio.Future:
+        """Queue a document deletion; the future resolves to the deletion result"""
+        return self._enqueue("delete_document", doc_id)
+
+    async def flush(self):
+        """Wait until every call queued so far has been sent and resolved"""
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def close(self):
+        """Flush pending calls and stop the background workers"""
+        await self.flush()
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        self._queues.clear()
+        self._workers.clear()
+
+    def _enqueue(self, op: str, *args) -> asyncio.Future:
+        """
+        Buffer a call for the given operation
+        Args:
+            op: Name of the AsyncSliteAPI method to call
+            args: Positional arguments for the call
+        Returns:
+            Future resolved with the call's result once its batch is flushed
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._queues.get(op)
+        if queue is None:
+            queue = self._queues[op] = asyncio.Queue()
+            self._workers[op] = loop.create_task(self._worker(op, queue))
+        queue.put_nowait((args, future))
+        return future
+
+    async def _worker(self, op: str, queue: asyncio.Queue):
+        """Collect calls for one operation into batches and flush them"""
+        loop = asyncio.get_running_loop()
+        method = getattr(self.api, op)
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.timeout_millis / 1000
             
-            if response.status_code == 204:
-                return {"status": "success", "message": f"Document {doc_id} deleted successfully"}
-            elif response.status_code == 429:
-                raise Exception("Rate limit exceeded")
-            elif response.status_code == 401:
-                raise Exception("Invalid API key")
-            elif response.status_code == 404:
-                raise Exception(f"Document {doc_id} not found")
-            else:
-                raise Exception(f"Error deleting document: {response.text}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error deleting document: {str(e)}")
-            raise Exception(f"Network error: {str(e)}")
+            while len(batch) < self.max_queue_length:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            logger.debug(f"Flushing {len(batch)} {op} calls")
+            results = await asyncio.gather(
+                *[method(*args) for args, _ in batch],
+                return_exceptions=True
+            )
+            
+            # Dispatch each result back to the caller that queued it
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                queue.task_done()
 
 if __name__ == "__main__":
     # Test the API connection
@@ -0,0 +1,413 @@
+import asyncio
+import gc
+from datetime import datetime
+from enum import Enum
+
+import orjson
+import pytest
+
+from slite_api import AsyncSliteAPI, BatchedSliteAPI, SliteAPI, SliteAPIBase, SliteEventHandler, _JSONStream, _MD_KEY_OPTIONS, _iter_json
+
+
+@pytest.fixture
+def api():
+    return SliteAPIBase("test-key")
+
+
+def text(value):
+    return {"type": "text", "text": value}
+
+
+def paragraph(*values):
+    return {"type": "paragraph", "content": [text(v) for v in values]}
+
+
+def bullet_list(*values):
+    return {
+        "type": "bulletList",
+        "content": [{"type": "listItem", "content": [paragraph(v)]} for v in values]
+    }
+
+
+def heading(value):
+    return {"type": "heading", "attrs": {"level": 2}, "content": [text(value)]}
+
+
+def test_blank_line_closes_paragraph(api):
+    doc = api._convert_to_prosemirror("first\n\nsecond")
+
+    assert doc["content"] == [paragraph("first"), paragraph(""), paragraph("second")]
+
+
+def test_paragraph_before_bullets_keeps_order(api):
+    doc = api._convert_to_prosemirror("intro\n- a\n- b\noutro")
+
+    assert doc["content"] == [paragraph("intro"), bullet_list("a", "b"), paragraph("outro")]
+
+
+def test_single_character_lines(api):
+    doc = api._convert_to_prosemirror("7\nx")
+
+    assert doc["content"] == [paragraph("7", "x")]
+
+
+def test_headers_and_numbered_sections(api):
+    doc = api._convert_to_prosemirror("Date: today\n1. Intro\n  - indented")
+
+    assert doc["content"] == [heading("Date: today"), heading("1. Intro"), bullet_list("indented")]
+
+
+def test_document_cache_hit_returns_cached_document(api):
+    first = api._convert_to_prosemirror("hello\n- world")
+
+    assert api._convert_to_prosemirror("hello\n- world") is first
+
+
+def test_document_cache_miss_converts_new_content(api):
+    first = api._convert_to_prosemirror("one")
+    second = api._convert_to_prosemirror("two")
+
+    assert second is not first
+    assert second["content"] == [paragraph("two")]
+
+
+def test_document_cache_collision_is_not_served(api):
+    content = "real content"
+    stale = {"type": "doc", "content": [paragraph("other content")]}
+    api._pm_cache[hash(content)] = ("other content", stale)
+
+    doc = api._convert_to_prosemirror(content)
+
+    assert doc is not stale
+    assert doc["content"] == [paragraph("real content")]
+    assert api._pm_cache[hash(content)][0] == content
+
+
+def test_document_cache_evicts_least_recently_used(api):
+    api._PM_CACHE_SIZE = 2
+    api._convert_to_prosemirror("a")
+    api._convert_to_prosemirror("b")
+    api._convert_to_prosemirror("a")
+    api._convert_to_prosemirror("c")
+
+    assert [entry[0] for entry in api._pm_cache.values()] == ["a", "c"]
+
+
+def test_line_cache_reuses_unchanged_lines(api):
+    first = api._convert_to_prosemirror("Date: today\n- item\nedited")
+    second = api._convert_to_prosemirror("Date: today\n- item\nedited again")
+
+    assert second["content"][0] is first["content"][0]
+    assert second["content"][1]["content"][0] is first["content"][1]["content"][0]
+    assert second["content"][2] == paragraph("edited again")
+
+
+def test_line_cache_evicts_least_recently_used(api):
+    api._LINE_CACHE_SIZE = 2
+    api._convert_to_prosemirror("a\nb")
+    api._convert_to_prosemirror("a\nc")
+
+    assert list(api._line_node_cache) == ["a", "c"]
+
+
+def test_session_retries_rate_limits_for_every_method():
+    slite = SliteAPI("test-key")
+    retry = slite.session.get_adapter("https://api.slite.com").max_retries
+    slite.close()
+
+    assert retry.is_retry("POST", 429)
+    assert retry.is_retry("PATCH", 429)
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("POST", 503)
+
+
+def test_stream_matches_single_encoding(api):
+    content = "Date: today\n" + "\n".join(f"- item {i}" for i in range(200)) + "\nclosing line"
+    data = {"title": "Notes", "content": api._convert_to_prosemirror(content)}
+
+    assert b"".join(_JSONStream(data, chunk_size=64)) == orjson.dumps(data)
+
+
+def test_stream_encodes_nested_nodes_separately(api):
+    data = {"title": "Notes", "content": bullet_list(*[f"item {i}" for i in range(100)])}
+
+    largest = max(len(piece) for piece in _iter_json(data))
+    assert largest == len(orjson.dumps(text("item 99")))
+
+
+def test_large_notes_are_streamed_by_content_size(api):
+    api._STREAM_MIN_SIZE = 10
+    data = {"title": "Notes", "content": api._convert_to_prosemirror("one long paragraph")}
+
+    assert isinstance(api._encode_note_body(data, 18), _JSONStream)
+    assert api._encode_note_body(data, 10) == orjson.dumps(data)
+
+
+class Listener:
+    def handle(self, data):
+        pass
+
+
+class SlottedListener:
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def handle(self, data):
+        self.calls.append(data)
+
+
+def test_methods_of_objects_without_weakref_are_held_strongly():
+    events = SliteEventHandler()
+    listener = SlottedListener()
+    events.on_document_created(listener.handle)
+
+    events.trigger_document_created({"id": "doc-1"})
+
+    assert listener.calls == [{"id": "doc-1"}]
+
+
+def test_nested_trigger_prunes_dead_handler_once():
+    events = SliteEventHandler()
+    calls = []
+
+    def handler(data):
+        calls.append(data)
+        if len(calls) == 1:
+            events.trigger("document_created", {"nested": True})
+
+    listener = Listener()
+    events.on("document_created", handler)
+    events.on("document_created", listener.handle)
+    del listener
+    gc.collect()
+
+    events.trigger("document_created", {})
+
+    assert calls == [{}, {"nested": True}]
+    assert len(events._handlers["document_created"]) == 1
+
+
+class FakeResponse:
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = orjson.dumps(body)
+        self.text = str(body)
+
+
+def test_async_wrapper_runs_coroutine_handlers_on_calling_loop():
+    slite = SliteAPI("test-key")
+    slite.session.request = lambda method, url, **kwargs: FakeResponse(201, {"id": "doc-1"})
+    handled = asyncio.Event()
+    seen = []
+
+    async def handler(data):
+        seen.append((asyncio.get_running_loop(), data["id"]))
+        handled.set()
+
+    slite.events.on_document_created(handler)
+
+    async def main():
+        await slite.acreate_document("Title", "Body")
+        await asyncio.wait_for(handled.wait(), 1)
+        return asyncio.get_running_loop()
+
+    try:
+        loop = asyncio.run(main())
+    finally:
+        slite.close()
+
+    assert seen == [(loop, "doc-1")]
+
+
+def test_cancelled_leader_does_not_cancel_collapsed_read():
+    async def main():
+        slite = AsyncSliteAPI("test-key")
+        release = asyncio.Event()
+        requests = []
+
+        async def request(method, url, **kwargs):
+            requests.append(url)
+            await release.wait()
+            return FakeResponse(200, {"id": "note-1"})
+
+        slite._session.request = request
+        leader = asyncio.create_task(slite.get_note("note-1"))
+        follower = asyncio.create_task(slite.get_note("note-1"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        result = await follower
+        await slite.close()
+        return leader, result, requests, slite._inflight
+
+    leader, result, requests, inflight = asyncio.run(main())
+
+    assert leader.cancelled()
+    assert result == {"id": "note-1"}
+    assert len(requests) == 1
+    assert inflight == {}
+
+
+def test_batched_calls_flush_at_queue_length_and_resolve_individually():
+    async def main():
+        slite = AsyncSliteAPI("test-key")
+
+        async def request(method, url, **kwargs):
+            title = orjson.loads(kwargs["content"])["title"]
+            if title == "missing":
+                return FakeResponse(500, {"error": "boom"})
+            return FakeResponse(201, {"id": title})
+
+        slite._session.request = request
+        async with BatchedSliteAPI(slite, timeout_millis=10_000, max_queue_length=2) as batched:
+            futures = [batched.create_document("first", "Body"), batched.create_document("missing", "Body")]
+            results = await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), 1)
+        await slite.close()
+        return results
+
+    created, failed = asyncio.run(main())
+
+    assert created["id"] == "first"
+    assert str(failed).startswith("Error creating document")
+
+
+def test_async_requests_retry_rate_limits_then_give_up(monkeypatch):
+    monkeypatch.setattr("slite_api.random.uniform", lambda a, b: 0)
+
+    async def main():
+        slite = AsyncSliteAPI("test-key", max_retries=2)
+        statuses = iter([429, 200, 429, 429, 429])
+
+        async def request(method, url, **kwargs):
+            return FakeResponse(next(statuses), {"id": "note-1"}, {"Retry-After": "0"})
+
+        slite._session.request = request
+        note = await slite.get_note("note-1")
+        with pytest.raises(Exception, match="Rate limit exceeded"):
+            await slite.get_note("note-1")
+        await slite.close()
+        return note
+
+    assert asyncio.run(main()) == {"id": "note-1"}
+
+
+def meeting_notes(date):
+    return {"metadata": {"date": date}, "sections": [{"title": "Actions", "content": [{"details": ["ship it"]}]}]}
+
+
+def test_meeting_notes_markdown_cache_hit(api):
+    first = api.format_meeting_notes_markdown(meeting_notes("2024-01-02"))
+    second = api.format_meeting_notes_markdown(meeting_notes("2024-01-02"))
+
+    assert second is first
+    assert len(api._md_cache) == 1
+    assert "- ship it" in first
+
+
+def test_meeting_notes_markdown_cache_evicts_least_recently_used(api):
+    api._MD_CACHE_SIZE = 2
+    for date in ("a", "b", "a", "c"):
+        api.format_meeting_notes_markdown(meeting_notes(date))
+
+    assert list(api._md_cache) == [orjson.dumps(meeting_notes(date), option=_MD_KEY_OPTIONS) for date in ("a", "c")]
+
+
+class Weekday(Enum):
+    MONDAY = "2024-01-01"
+
+
+@pytest.mark.parametrize("value, rendered", [
+    (datetime(2024, 1, 2, 3, 4, 5), "2024-01-02 03:04:05"),
+    (Weekday.MONDAY, "Weekday.MONDAY"),
+])
+def test_meeting_notes_markdown_cache_does_not_alias_json_equivalents(api, value, rendered):
+    api.format_meeting_notes_markdown(meeting_notes(orjson.loads(orjson.dumps(value))))
+    markdown = api.format_meeting_notes_markdown(meeting_notes(value))
+
+    assert f"**Date:** {rendered}" in markdown
+    assert len(api._md_cache) == 1
+
+
+def test_bulk_creation_reports_each_document_status():
+    async def main():
+        slite = AsyncSliteAPI("test-key")
+
+        async def request(method, url, **kwargs):
+            title = orjson.loads(kwargs["content"])["title"]
+            if title == "cancelled":
+                raise asyncio.CancelledError()
+            if title == "failed":
+                return FakeResponse(500, {"error": "boom"})
+            return FakeResponse(201, {"id": title})
+
+        slite._session.request = request
+        statuses = await slite.create_documents_bulk("folder-1", [("created", "Body"), ("failed", "Body"), ("cancelled", "Body")])
+        await slite.close()
+        return statuses
+
+    created, failed, cancelled = asyncio.run(main())
+
+    assert created["status"] == "success"
+    assert created["document"]["id"] == "created"
+    assert failed["status"] == "error"
+    assert failed["title"] == "failed"
+    assert failed["message"].startswith("Error creating document")
+    assert cancelled["status"] == "error"
+    assert cancelled["title"] == "cancelled"
+
+
+class AsyncCallable:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, data):
+        self.calls.append(data)
+
+
+def test_handlers_returning_coroutines_are_awaited():
+    events = SliteEventHandler()
+    instance = AsyncCallable()
+    wrapped = AsyncCallable()
+    events.on_document_created(instance)
+    events.on_document_created(lambda data: wrapped(data))
+
+    events.trigger_document_created({"id": "sync"})
+
+    async def main():
+        await asyncio.gather(*events.trigger_document_created({"id": "async"}))
+
+    asyncio.run(main())
+
+    assert instance.calls == [{"id": "sync"}, {"id": "async"}]
+    assert wrapped.calls == [{"id": "sync"}, {"id": "async"}]
+
+
+def test_max_retries_counts_retries_after_the_first_attempt():
+    async def main():
+        slite = AsyncSliteAPI("test-key", max_retries=0)
+        attempts = []
+
+        async def request(method, url, **kwargs):
+            attempts.append(url)
+            return FakeResponse(429, {}, {"Retry-After": "0"})
+
+        slite._session.request = request
+        with pytest.raises(Exception, match="Rate limit exceeded"):
+            await slite.get_note("note-1")
+        await slite.close()
+        return attempts
+
+    assert len(asyncio.run(main())) == 1
+
+    slite = SliteAPI("test-key", max_retries=2)
+    assert slite.session.get_adapter("https://api.slite.com").max_retries.total == 2
+    slite.close()
+
+    for client in (SliteAPI, AsyncSliteAPI):
+        with pytest.raises(ValueError):
+            client("test-key", max_retries=-1)